@@ -4,7 +4,6 @@ Upload CSV/Excel, select operations, preview, and download result.
 """
 
 import sys
-import tempfile
 import warnings
 import io
 from pathlib import Path
@@ -118,9 +117,7 @@ def render_pipeline_strip(selected_steps: list):
 
 
 # File helpers
-def detect_encoding(uploaded_file) -> str:
-    raw = uploaded_file.read(50_000)
-    uploaded_file.seek(0)
+def detect_encoding(raw: bytes) -> str:
     for enc in config.CSV_ENCODINGS:
         try:
             raw.decode(enc)
@@ -130,80 +127,168 @@ def detect_encoding(uploaded_file) -> str:
     return config.CSV_ENCODINGS[0]
 
 
+# Arrow-backed string columns store contiguous UTF-8 instead of one Python
+# object per cell — drop_duplicates hashes raw bytes and memory shrinks
+# several-fold. Only requestable when pyarrow is importable.
+try:
+    import pyarrow  # noqa: F401
+    _DTYPE_BACKEND_KW = {"dtype_backend": "pyarrow"}
+except ImportError:
+    _DTYPE_BACKEND_KW = {}
+
+
+def _read_csv_pyarrow(raw: bytes, encoding: str) -> pd.DataFrame:
+    """Parse CSV bytes with pyarrow's multi-threaded reader.
+
+    Raises ImportError when pyarrow is not installed; callers fall back
+    to pd.read_csv.
+    """
+    import pyarrow.csv as pacsv
+
+    table = pacsv.read_csv(
+        io.BytesIO(raw),
+        read_options=pacsv.ReadOptions(
+            use_threads=True, block_size=8 << 20, encoding=encoding,
+        ),
+        parse_options=pacsv.ParseOptions(invalid_row_handler=lambda row: "skip"),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# Cached so a sidebar interaction (Streamlit rerun) does not re-parse the
+# upload; keyed on (name, size, file_id) instead of hashing the file bytes.
+@st.cache_data(
+    show_spinner=False,
+    max_entries=4,
+    hash_funcs={
+        "streamlit.runtime.uploaded_file_manager.UploadedFile":
+            lambda f: (f.name, f.size, f.file_id),
+    },
+)
 def load_uploaded_file(uploaded_file) -> tuple[pd.DataFrame, str]:
     suffix = Path(uploaded_file.name).suffix.lower()
+    raw = uploaded_file.getvalue()
     if suffix in (".xlsx", ".xls"):
-        return pd.read_excel(uploaded_file), "n/a"
+        # calamine parses XLSX in native code, far faster than openpyxl;
+        # fall back to the default engine when it is not installed.
+        try:
+            return pd.read_excel(io.BytesIO(raw), engine="calamine", **_DTYPE_BACKEND_KW), "n/a"
+        except (ImportError, ValueError):
+            return pd.read_excel(io.BytesIO(raw), **_DTYPE_BACKEND_KW), "n/a"
     if suffix == ".csv":
-        encoding = detect_encoding(uploaded_file)
-        return (
-            pd.read_csv(uploaded_file, encoding=encoding, on_bad_lines="skip"),
-            encoding,
+        encoding = detect_encoding(raw[:50_000])
+        try:
+            return _read_csv_pyarrow(raw, encoding), encoding
+        except Exception:
+            pass
+        # Chunked read keeps peak memory near one chunk during parsing
+        # instead of ~3x the file size for a single monolithic read.
+        chunks = pd.read_csv(
+            io.BytesIO(raw),
+            encoding=encoding,
+            on_bad_lines="skip",
+            chunksize=200_000,
+            **_DTYPE_BACKEND_KW,
         )
+        return pd.concat(chunks, ignore_index=True), encoding
     raise ValueError("Unsupported format. Use CSV or Excel (.xlsx, .xls).")
 
 
+# Download serialization — cached so switching the format radio (a rerun)
+# does not rebuild the bytes. xlsxwriter writes cells much faster than
+# openpyxl; fall back when it is not installed.
+@st.cache_data(show_spinner=False, max_entries=4)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def to_xlsx_bytes(df: pd.DataFrame) -> bytes:
+    buf = io.BytesIO()
+    try:
+        df.to_excel(buf, index=False, engine="xlsxwriter")
+    except ImportError:
+        df.to_excel(buf, index=False, engine="openpyxl")
+    return buf.getvalue()
+
+
 # Pipeline runner
 def run_pipeline(
-    temp_path: str,
+    input_df: pd.DataFrame,
     steps: list,
     dup_columns: list | None,
     translate_columns_list: list | None,
     target_lang: str,
     source_lang: str,
     progress_placeholder,
-) -> pd.DataFrame | None:
-    df = None
+) -> pd.DataFrame:
+    df = input_df
     n = len(steps)
     for i, step in enumerate(steps):
         progress_placeholder.progress((i + 1) / n, text=f"Running: {step}")
         try:
             if step == "Normalize headers":
-                df = normalize_headers(file_path=temp_path)
+                df = normalize_headers(df=df)
 
             elif step == "Remove duplicates":
                 df = remove_duplicates(
                     columns=dup_columns if dup_columns else None,
-                    file_path=temp_path,
+                    df=df,
                 )
 
             elif step == "Add date metadata":
-                df = add_dates_metadata(file_path=temp_path)
+                df = add_dates_metadata(df=df)
 
             elif step == "Translate columns":
                 def _translate_progress(current: int, total: int, message: str) -> None:
                     pct = (i + (current / total if total else 0)) / n
                     progress_placeholder.progress(max(0.0, min(1.0, pct)), text=message)
-                try:
-                    df = translate_columns(
-                        target_language=target_lang,
-                        source_language=source_lang,
-                        columns_to_process=translate_columns_list,
-                        file_path=temp_path,
-                        progress_callback=_translate_progress,
-                    )
-                except TypeError:
-                    df = translate_columns(
-                        target_language=target_lang,
-                        source_language=source_lang,
-                        columns_to_process=translate_columns_list,
-                        file_path=temp_path,
-                    )
+                # Translation workers block on HTTP, not the CPU, so fan
+                # out well past the core count.
+                df = translate_columns(
+                    target_language=target_lang,
+                    source_language=source_lang,
+                    columns_to_process=translate_columns_list,
+                    df=df,
+                    progress_callback=_translate_progress,
+                    max_workers=32,
+                )
             else:
                 continue
 
-            if i < n - 1 and df is not None:
-                df.to_csv(temp_path, index=False)
-
-        except Exception as e:
+        except Exception:
             progress_placeholder.progress(1.0, text="Error")
-            st.error(str(e))
-            return None
+            raise
 
     progress_placeholder.progress(1.0, text="Done")
     return df
 
 
+# Cached on the upload identity + step configuration; the DataFrame and the
+# progress placeholder are underscore-prefixed so Streamlit skips hashing
+# them. Toggling an unrelated widget after a run reuses the cached result.
+@st.cache_data(show_spinner=False, max_entries=8)
+def run_pipeline_cached(
+    upload_key: tuple,
+    steps: tuple,
+    dup_columns: tuple | None,
+    translate_columns_list: tuple | None,
+    target_lang: str,
+    source_lang: str,
+    _input_df: pd.DataFrame,
+    _progress_placeholder,
+) -> pd.DataFrame:
+    return run_pipeline(
+        _input_df,
+        list(steps),
+        list(dup_columns) if dup_columns is not None else None,
+        list(translate_columns_list) if translate_columns_list is not None else None,
+        target_lang,
+        source_lang,
+        _progress_placeholder,
+    )
+
+
 # Main
 def main():
     # ── Hero header ──────────────────────────────────────────────────────
@@ -237,11 +322,20 @@ def main():
         """, unsafe_allow_html=True)
         return
 
-    try:
-        input_df, _ = load_uploaded_file(uploaded_file)
-    except Exception as e:
-        st.error(f"Failed to load file: {e}")
-        return
+    # Keep the parsed frame as a live object in session state — no cache
+    # pickle round-trip on reruns; re-parse only when the upload changes.
+    if st.session_state.get("input_df_id") != uploaded_file.file_id:
+        try:
+            input_df, _ = load_uploaded_file(uploaded_file)
+        except Exception as e:
+            st.error(f"Failed to load file: {e}")
+            return
+        st.session_state["input_df"] = input_df
+        st.session_state["input_df_id"] = uploaded_file.file_id
+        # A new upload invalidates any previous pipeline result.
+        st.session_state.pop("result_df", None)
+        st.session_state.pop("result_key", None)
+    input_df = st.session_state["input_df"]
 
     col_names = list(input_df.columns)
     selected_steps, dup_columns, translate_cols_list, target_lang, source_lang = render_sidebar(col_names)
@@ -289,73 +383,81 @@ def main():
 
     if run_clicked and selected_steps:
         progress_placeholder = st.empty()
-        fd, tmp_path = tempfile.mkstemp(suffix=".csv")
+        trans_cols = translate_cols_list if "Translate columns" in selected_steps else None
+        run_key = (
+            (uploaded_file.name, uploaded_file.size, uploaded_file.file_id),
+            tuple(selected_steps),
+            tuple(dup_columns) if dup_columns else None,
+            tuple(trans_cols) if trans_cols else None,
+            target_lang, source_lang,
+        )
         try:
-            with open(fd, "w", encoding="utf-8", newline="") as f:
-                input_df.to_csv(f, index=False)
-            result_df = run_pipeline(
-                tmp_path, selected_steps, dup_columns,
-                translate_cols_list if "Translate columns" in selected_steps else None,
-                target_lang, source_lang, progress_placeholder,
+            result_df = run_pipeline_cached(
+                *run_key,
+                input_df, progress_placeholder,
             )
-        finally:
-            try:
-                Path(tmp_path).unlink(missing_ok=True)
-            except OSError:
-                pass
-
-        if result_df is None:
+        except Exception as e:
+            st.error(str(e))
             return
+        # Persist the live result so later reruns (e.g. toggling the
+        # download format) render it without touching the pipeline cache.
+        st.session_state["result_df"] = result_df
+        st.session_state["result_key"] = run_key
 
-        # ── Results ──────────────────────────────────────────────────────
-        st.markdown('<div class="section-divider" style="margin-top:1.5rem"><span class="section-divider-label">Results</span><span class="section-divider-line"></span></div>', unsafe_allow_html=True)
-
-        r1, r2 = st.columns(2, gap="medium")
-        with r1:
-            st.markdown(f"""
-            <div class="status-box rows">
-                <div class="status-box-glow"></div>
-                <div class="status-icon">Output Rows</div>
-                <div class="status-val">{len(result_df):,}</div>
-                <div class="status-lbl">Records after processing</div>
-            </div>""", unsafe_allow_html=True)
-        with r2:
-            delta = len(input_df) - len(result_df)
-            sign = "−" if delta > 0 else "+"
-            st.markdown(f"""
-            <div class="status-box cols">
-                <div class="status-box-glow"></div>
-                <div class="status-icon">Delta</div>
-                <div class="status-val">{sign}{abs(delta):,}</div>
-                <div class="status-lbl">Rows {"removed" if delta > 0 else "added"}</div>
-            </div>""", unsafe_allow_html=True)
-
-        st.markdown('<div style="margin-top:1rem"></div>', unsafe_allow_html=True)
-        st.dataframe(result_df.head(100), use_container_width=True)
-        st.caption(f"Showing first 100 of {len(result_df):,} rows.")
-
-        # ── Download ──────────────────────────────────────────────────────
-        st.markdown('<div class="section-divider" style="margin-top:1rem"><span class="section-divider-label">Download</span><span class="section-divider-line"></span></div>', unsafe_allow_html=True)
-        out_format = st.radio("Format", ["CSV", "Excel"], horizontal=True, key="out_fmt")
-        base_name = Path(uploaded_file.name).stem
-
-        if out_format == "CSV":
-            st.download_button(
-                label="⬇  Download CSV",
-                data=result_df.to_csv(index=False).encode("utf-8"),
-                file_name=f"{base_name}_processed.csv",
-                mime="text/csv",
-            )
-        else:
-            buf = io.BytesIO()
-            result_df.to_excel(buf, index=False, engine="openpyxl")
-            buf.seek(0)
-            st.download_button(
-                label="⬇  Download Excel",
-                data=buf.getvalue(),
-                file_name=f"{base_name}_processed.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            )
+    result_df = st.session_state.get("result_df")
+    if result_df is not None:
+        render_results(result_df, len(input_df), Path(uploaded_file.name).stem)
+
+
+# Results + download live in a fragment: toggling the format radio reruns
+# only this subtree, not the whole script.
+@st.fragment
+def render_results(result_df: pd.DataFrame, input_rows: int, base_name: str):
+    # ── Results ──────────────────────────────────────────────────────────
+    st.markdown('<div class="section-divider" style="margin-top:1.5rem"><span class="section-divider-label">Results</span><span class="section-divider-line"></span></div>', unsafe_allow_html=True)
+
+    r1, r2 = st.columns(2, gap="medium")
+    with r1:
+        st.markdown(f"""
+        <div class="status-box rows">
+            <div class="status-box-glow"></div>
+            <div class="status-icon">Output Rows</div>
+            <div class="status-val">{len(result_df):,}</div>
+            <div class="status-lbl">Records after processing</div>
+        </div>""", unsafe_allow_html=True)
+    with r2:
+        delta = input_rows - len(result_df)
+        sign = "−" if delta > 0 else "+"
+        st.markdown(f"""
+        <div class="status-box cols">
+            <div class="status-box-glow"></div>
+            <div class="status-icon">Delta</div>
+            <div class="status-val">{sign}{abs(delta):,}</div>
+            <div class="status-lbl">Rows {"removed" if delta > 0 else "added"}</div>
+        </div>""", unsafe_allow_html=True)
+
+    st.markdown('<div style="margin-top:1rem"></div>', unsafe_allow_html=True)
+    st.dataframe(result_df.head(100), use_container_width=True)
+    st.caption(f"Showing first 100 of {len(result_df):,} rows.")
+
+    # ── Download ──────────────────────────────────────────────────────────
+    st.markdown('<div class="section-divider" style="margin-top:1rem"><span class="section-divider-label">Download</span><span class="section-divider-line"></span></div>', unsafe_allow_html=True)
+    out_format = st.radio("Format", ["CSV", "Excel"], horizontal=True, key="out_fmt")
+
+    if out_format == "CSV":
+        st.download_button(
+            label="⬇  Download CSV",
+            data=to_csv_bytes(result_df),
+            file_name=f"{base_name}_processed.csv",
+            mime="text/csv",
+        )
+    else:
+        st.download_button(
+            label="⬇  Download Excel",
+            data=to_xlsx_bytes(result_df),
+            file_name=f"{base_name}_processed.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
 
 
 if __name__ == "__main__":
@@ -3,16 +3,8 @@ Configuration file for the RDB application.
 Contains file paths, settings, and other configuration constants.
 """
 
-import sys
 from pathlib import Path
 
-if str(Path(__file__).parent) not in sys.path:
-    sys.path.insert(0, str(Path(__file__).parent))
-
-_utils_dir = Path(__file__).parent / "src" / "utils"
-if str(_utils_dir) not in sys.path:
-    sys.path.insert(0, str(_utils_dir))
-
 PROJECT_ROOT = Path(__file__).parent
 
 DATA_DIR = PROJECT_ROOT / "data"
@@ -21,6 +13,10 @@ RAW_DATA_DIR = DATA_DIR / "raw"
 
 RAW_DATA_FILE = RAW_DATA_DIR / "test.csv"
 
+# On-disk translation cache — survives across runs so overlapping
+# datasets do not re-pay the translation API cost.
+TRANSLATION_CACHE_FILE = DATA_DIR / "translation_cache.sqlite"
+
 CSV_ENCODINGS = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
 CSV_DELIMITERS = ['\t', ',', ';']
 
@@ -1,22 +1,33 @@
-"""
-Main src package - sets up all paths for the project.
-"""
-import sys
-from pathlib import Path
-
-_src_dir = Path(__file__).parent
-
-if str(_src_dir) not in sys.path:
-    sys.path.insert(0, str(_src_dir))
-
-from utils.csv_handler import read_csv, write_csv, append_csv, read_csv_to_dict
-from cleaning.normalize_headers import normalize_headers
-from cleaning.removing_duplicates import remove_duplicates
-from transformation.add_dates_metadata import add_dates_metadata
-from transformation.translate_columns import translate_columns
-
-__all__ = [
-    'read_csv', 'write_csv', 'append_csv', 'read_csv_to_dict',
-    'normalize_headers', 'remove_duplicates', 'add_dates_metadata',
-    'translate_columns'
-]
+"""
+Main src package - sets up all paths for the project.
+"""
+import importlib
+
+# Lazy (PEP 562) attribute access: importing src stays cheap because the
+# translation stack (HTTP client, langdetect, sklearn) only loads when
+# translate_columns is actually requested.
+_LAZY_IMPORTS = {
+    'read_csv': 'src.utils.csv_handler',
+    'write_csv': 'src.utils.csv_handler',
+    'append_csv': 'src.utils.csv_handler',
+    'read_csv_to_dict': 'src.utils.csv_handler',
+    'normalize_headers': 'src.cleaning.normalize_headers',
+    'remove_duplicates': 'src.cleaning.removing_duplicates',
+    'add_dates_metadata': 'src.transformation.add_dates_metadata',
+    'translate_columns': 'src.transformation.translate_columns',
+}
+
+__all__ = [
+    'read_csv', 'write_csv', 'append_csv', 'read_csv_to_dict',
+    'normalize_headers', 'remove_duplicates', 'add_dates_metadata',
+    'translate_columns'
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
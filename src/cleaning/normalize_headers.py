@@ -1,10 +1,13 @@
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional
 import pandas as pd
 import config
-from csv_handler import read_csv
+from src.utils.csv_handler import read_csv
 
-def normalize_headers(file_path: Optional[str | Path] = None) -> pd.DataFrame:
+def normalize_headers(
+    file_path: Optional[str | Path] = None,
+    df: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
     """
     Normalize the header row of the dataframe:
     - Trim excess spaces from column names
@@ -12,21 +15,19 @@ def normalize_headers(file_path: Optional[str | Path] = None) -> pd.DataFrame:
 
     Args:
         file_path: Path to CSV file. If None, uses config.RAW_DATA_FILE (for CLI/script).
+        df: DataFrame to process in-memory. If provided, no file is read.
 
     Returns:
         DataFrame with normalized headers
     """
-    path = str(file_path) if file_path is not None else str(config.RAW_DATA_FILE)
-    df = read_csv(path)
-    
-    df_normalized = df.copy()
-    new_columns: Dict[str, str] = {}
-    
-    for col in df_normalized.columns:
-        trimmed_col = ' '.join(str(col).split())
-        normalized_col = trimmed_col.title()
-        new_columns[col] = normalized_col
-    
-    df_normalized.rename(columns=new_columns, inplace=True)
-    
-    return df_normalized
+    if df is None:
+        path = str(file_path) if file_path is not None else str(config.RAW_DATA_FILE)
+        df = read_csv(path)
+
+    # Renaming only touches the column index, so a full-frame copy is
+    # unnecessary — a shallow copy shares the data but gives this frame
+    # its own index, keeping the caller's column labels untouched.
+    df = df.copy(deep=False)
+    df.columns = [' '.join(str(col).split()).title() for col in df.columns]
+
+    return df
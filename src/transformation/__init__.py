@@ -1,2 +1 @@
-# Transformation package
-from transformation.translate_columns import translate_columns
+# Transformation package
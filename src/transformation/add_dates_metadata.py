@@ -1,17 +1,27 @@
 from pathlib import Path
 from typing import List, Dict, Optional
+import numpy as np
 import pandas as pd
 import config
-from csv_handler import read_csv_to_dict, read_csv
+from src.utils.csv_handler import read_csv_to_dict, read_csv
 
-def add_dates_metadata(file_path: Optional[str | Path] = None) -> pd.DataFrame:
+_MONTH_ABBR = np.array(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+    dtype=object,
+)
+
+def add_dates_metadata(
+    file_path: Optional[str | Path] = None,
+    df: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
     """
     Add date metadata columns to the dataset based on the Date column.
-    Reads the raw data file as a list, finds the Date column (case-insensitive),
-    and adds derived columns.
+    Finds the Date column (case-insensitive) and adds derived columns.
 
     Args:
         file_path: Path to CSV file. If None, uses config.RAW_DATA_FILE (for CLI/script).
+        df: DataFrame to process in-memory. If provided, no file is read.
 
     Returns:
         DataFrame with date metadata columns added
@@ -19,14 +29,19 @@ def add_dates_metadata(file_path: Optional[str | Path] = None) -> pd.DataFrame:
     Raises:
         ValueError: If the Date column is not found in the dataset
     """
-    path = str(file_path) if file_path is not None else str(config.RAW_DATA_FILE)
-    data_list: List[Dict] = read_csv_to_dict(path)
-    
-    if not data_list:
+    if df is None:
+        path = str(file_path) if file_path is not None else str(config.RAW_DATA_FILE)
+        data_list: List[Dict] = read_csv_to_dict(path)
+
+        if not data_list:
+            raise ValueError("The dataset is empty")
+
+        df = pd.DataFrame(data_list)
+
+    if df.empty:
         raise ValueError("The dataset is empty")
-    
-    first_row = data_list[0]
-    all_cols = list(first_row.keys())
+
+    all_cols = list(df.columns)
     col_lower = {c.lower(): c for c in all_cols}
     # Prefer exact "date", then common date-like names, then any column containing "date"
     date_candidates = [
@@ -48,43 +63,42 @@ def add_dates_metadata(file_path: Optional[str | Path] = None) -> pd.DataFrame:
                 date_column = col
                 break
     if date_column is None:
-        available_columns = list(first_row.keys())
         raise ValueError(
             f"Date column not found in the dataset. "
-            f"Available columns: {available_columns}"
-        )
-    
-    df = pd.DataFrame(data_list)
-    
-    df_with_metadata = df.copy()
-    
-    if date_column not in df_with_metadata.columns:
-        available_columns = list(df_with_metadata.columns)
-        raise ValueError(
-            f"Date column '{date_column}' not found in the DataFrame. "
-            f"Available columns: {available_columns}"
+            f"Available columns: {all_cols}"
         )
-    
+
     try:
-        df_with_metadata[date_column] = pd.to_datetime(df_with_metadata[date_column], errors='coerce', dayfirst=True)
-        
-        df_with_metadata['Year'] = df_with_metadata[date_column].dt.year
-        df_with_metadata['Month'] = df_with_metadata[date_column].dt.strftime('%b') 
-        df_with_metadata['Day'] = df_with_metadata[date_column].dt.day
-        df_with_metadata['Quarter'] = df_with_metadata[date_column].dt.quarter
-        
-        columns = list(df_with_metadata.columns)
-        date_index = columns.index(date_column)
-        
+        # assign() already returns a new frame, so no up-front full copy.
+        # format='mixed' + cache=True keeps parsing on the vectorized C
+        # path and parses each distinct string only once, instead of
+        # falling back to the per-row dateutil parser.
+        dt = pd.to_datetime(
+            df[date_column], errors='coerce', dayfirst=True,
+            format='mixed', cache=True,
+        )
+        # One vectorized gather into the abbreviation table instead of a
+        # strftime call per row.
+        valid = dt.notna().to_numpy()
+        month = np.where(
+            valid,
+            _MONTH_ABBR[dt.dt.month.fillna(1).astype(int).to_numpy() - 1],
+            None,
+        )
+        df_with_metadata = df.assign(**{
+            date_column: dt,
+            'Year': dt.dt.year,
+            'Month': month,
+            'Day': dt.dt.day,
+            'Quarter': dt.dt.quarter,
+        })
+
+        # Build the new order in one pass: everything as-is, with the
+        # metadata columns slotted in right after the date column.
         metadata_cols = ['Year', 'Month', 'Day', 'Quarter']
-        for col in metadata_cols:
-            if col in columns:
-                columns.remove(col)
-        
-        for i, col in enumerate(metadata_cols, 0):
-            columns.insert(date_index + i, col)
-        
-        df_with_metadata = df_with_metadata[columns]
+        base = [c for c in df_with_metadata.columns if c not in set(metadata_cols)]
+        idx = base.index(date_column) + 1
+        df_with_metadata = df_with_metadata[base[:idx] + metadata_cols + base[idx:]]
         
     except Exception as e:
         raise ValueError(
@@ -2,15 +2,354 @@ from typing import List, Dict, Set, Tuple, Optional, Callable
 import pandas as pd
 import numpy as np
 import config
-from csv_handler import read_csv_to_dict
+from src.utils.csv_handler import read_csv
 from deep_translator import GoogleTranslator
 from langdetect import detect, LangDetectException
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, local
+import hashlib
 import os
+import sqlite3
 from tqdm import tqdm
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+# Near-duplicate grouping: texts within this cosine/Jaccard similarity are
+# translated once and share the result.
+_SIMILARITY_THRESHOLD = 0.85
+# Below this many unique texts the dense TF-IDF path is cheap enough; above
+# it the NxN similarity matrix becomes the bottleneck and MinHash-LSH
+# (linear time and memory) takes over.
+_LSH_MIN_TEXTS = 2000
+_MINHASH_PERMS = 128
+# Below this many texts, vectorize + similarity costs more than simply
+# translating each text once — skip sklearn entirely (including its
+# import, which is deferred into the grouping helper).
+_SIMILARITY_MIN_TEXTS = 200
+
+# Arrow-backed strings keep .str ops in Arrow's C++ kernels and store
+# contiguous UTF-8 instead of one Python object per cell; fall back to the
+# NumPy-backed string dtype when pyarrow is unavailable.
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string'
+
+# One GoogleTranslator per worker thread: construction re-parses config on
+# every call, which adds up across thousands of chunks. deep-translator
+# drives its own HTTP client internally, so per-thread reuse is the
+# connection pooling available at this layer.
+_tls = local()
+
+# Persistent cross-run cache: repeated runs over overlapping datasets hit
+# disk instead of the translation API. Keyed by language pair + text hash;
+# all access is best-effort, so a broken cache never fails a run.
+_disk_cache_lock = Lock()
+_disk_cache_conn: Optional[sqlite3.Connection] = None
+
+
+def _disk_cache() -> sqlite3.Connection:
+    global _disk_cache_conn
+    if _disk_cache_conn is None:
+        # sqlite refuses to create the database file if its directory is
+        # missing (e.g. a fresh clone without data/), and the best-effort
+        # wrappers would silently disable the cache.
+        config.TRANSLATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(config.TRANSLATION_CACHE_FILE), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, translation TEXT NOT NULL)"
+        )
+        _disk_cache_conn = conn
+    return _disk_cache_conn
+
+
+def _disk_cache_key(source: str, target: str, text: str) -> str:
+    return f"{target}:{source}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+
+def _disk_cache_get(source: str, target: str, text: str) -> Optional[str]:
+    try:
+        with _disk_cache_lock:
+            row = _disk_cache().execute(
+                "SELECT translation FROM translations WHERE key = ?",
+                (_disk_cache_key(source, target, text),),
+            ).fetchone()
+        return row[0] if row else None
+    except Exception:
+        return None
+
+
+def _disk_cache_put_many(source: str, target: str, items: List[Tuple[str, str]]) -> None:
+    """Insert (text, translation) pairs in one batched commit."""
+    if not items:
+        return
+    try:
+        with _disk_cache_lock:
+            conn = _disk_cache()
+            conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translation) VALUES (?, ?)",
+                [(_disk_cache_key(source, target, text), translation)
+                 for text, translation in items],
+            )
+            conn.commit()
+    except Exception:
+        pass
+
+
+def _get_translator(source: str, target: str) -> GoogleTranslator:
+    key = (source, target)
+    if getattr(_tls, 'translator_key', None) != key:
+        _tls.translator = GoogleTranslator(source=source, target=target)
+        _tls.translator_key = key
+    return _tls.translator
+
+
+class _TranslationSession:
+    """Translation state for one translate_columns run.
+
+    Binds the language pair and the shared caches once at construction,
+    so the hot per-group methods work through one object's attributes
+    instead of a closure full of enclosing-scope cell dereferences, and
+    can be handed straight to an executor.
+    """
+
+    def __init__(self, source_language: str, target_language: str):
+        self.source_language = source_language
+        self.target_language = target_language
+        # Thread-safe translation cache to avoid re-translating duplicate
+        # texts. Shared across columns so a value repeated in several
+        # columns is translated once.
+        self.translation_cache: Dict[str, str] = {}
+        self.translation_cache_lock = Lock()
+        # Cache for language detection results
+        self.lang_cache: Dict[str, str] = {}
+        self.lang_cache_lock = Lock()
+
+    def resolve_group_locally(self, group: List[str]) -> Tuple[Optional[Dict[str, str]], str, str]:
+        """Resolve a group without network I/O when possible.
+
+        Returns (translations_dict, status, representative); translations
+        is None when the group still needs an API call.
+        """
+        # Use the first (shortest) text as representative for translation
+        representative = min(group, key=len).strip()
+
+        # Check cache first: in-memory, then the on-disk cross-run cache
+        with self.translation_cache_lock:
+            cached_translation = self.translation_cache.get(representative)
+        if cached_translation is None:
+            cached_translation = _disk_cache_get(
+                self.source_language, self.target_language, representative)
+            if cached_translation is not None:
+                with self.translation_cache_lock:
+                    self.translation_cache[representative] = cached_translation
+        if cached_translation is not None:
+            return {text: cached_translation for text in group}, 'cached', representative
+
+        # Language detection only for strings longer than 3 characters
+        if len(representative) > 3:
+            # Cheap pre-filter: non-ASCII text cannot be English, so when
+            # targeting 'en' skip the n-gram model and go straight to
+            # translation. ASCII text still runs through langdetect —
+            # Latin-script languages all fit in ASCII, so the charset
+            # alone cannot prove the text is already English.
+            if self.target_language == 'en' and not representative.isascii():
+                detected_lang = ''
+            else:
+                with self.lang_cache_lock:
+                    detected_lang = self.lang_cache.get(representative)
+                if detected_lang is None:
+                    try:
+                        detected_lang = detect(representative)
+                    except (LangDetectException, Exception):
+                        detected_lang = ''
+                    with self.lang_cache_lock:
+                        self.lang_cache[representative] = detected_lang
+
+            if detected_lang == self.target_language:
+                # Already in target language
+                with self.translation_cache_lock:
+                    self.translation_cache[representative] = representative
+                return {text: representative for text in group}, 'skipped', representative
+
+        return None, '', representative
+
+    def translate_chunk(self, chunk: List[Tuple[List[str], str]]) -> List[Tuple[Dict[str, str], str]]:
+        """Translate a chunk of (group, representative) pairs.
+
+        translate_batch issues one request per text under the hood, so a
+        chunk is purely a unit of work for the pool — it cuts per-group
+        task scheduling, not HTTP round-trips. On batch failure each
+        representative is retried individually so one bad text does not
+        poison the chunk.
+        """
+        representatives = [rep for _, rep in chunk]
+        try:
+            translator = _get_translator(self.source_language, self.target_language)
+        except Exception:
+            # Without a translator every group in the chunk fails the same
+            # way; never let the exception escape into the executor.
+            return [({text: 'NA' for text in group}, 'error') for group, _ in chunk]
+        try:
+            translated_texts = translator.translate_batch(representatives)
+        except Exception:
+            translated_texts = []
+            for rep in representatives:
+                try:
+                    translated_texts.append(translator.translate(rep))
+                except Exception:
+                    translated_texts.append(None)
+
+        results = []
+        with self.translation_cache_lock:
+            for (group, _), translated_text in zip(chunk, translated_texts):
+                if translated_text is None:
+                    # On error, return 'NA' for all texts in group
+                    results.append(({text: 'NA' for text in group}, 'error'))
+                else:
+                    # Cache and apply to all similar texts in group
+                    for text in group:
+                        self.translation_cache[text] = translated_text
+                    results.append(({text: translated_text for text in group}, 'translated'))
+        return results
+
+
+def _group_texts_hashed(unique_texts: List[str]) -> List[List[str]]:
+    """Group near-duplicate texts via hashed vectors + cosine similarity.
+
+    HashingVectorizer maps tokens straight into a fixed feature space —
+    no vocabulary dict, no fit pass — and emits L2-normalized sparse CSR
+    rows, so cosine similarity is just the sparse Gram product
+    vectors @ vectors.T without ever allocating a dense NxN matrix.
+    """
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    vectorizer = HashingVectorizer(
+        lowercase=True,
+        stop_words=None,  # Don't remove stop words for better similarity detection
+        ngram_range=(1, 2),  # Use unigrams and bigrams
+        n_features=2 ** 14,  # Fixed hash space, no vocabulary to build
+        alternate_sign=False,
+        norm='l2',
+    )
+    vectors = vectorizer.transform(unique_texts)
+    similarity = vectors @ vectors.T  # sparse: only nonzero pairs stored
+
+    # Treat above-threshold similarity as graph edges and label the
+    # components in one compiled BFS pass, instead of a Python loop with
+    # per-row threshold scans.
+    from scipy.sparse.csgraph import connected_components
+
+    adjacency = similarity >= _SIMILARITY_THRESHOLD
+    n_groups, labels = connected_components(adjacency, directed=False)
+
+    groups: List[List[str]] = [[] for _ in range(n_groups)]
+    for text, label in zip(unique_texts, labels):
+        groups[label].append(text)
+
+    return groups
+
+
+def _group_texts_minhash(unique_texts: List[str]) -> List[List[str]]:
+    """Group near-duplicate texts with MinHash + LSH banding.
+
+    Roughly O(N) in time and memory versus the O(N^2) dense similarity
+    matrix, so it scales to columns with very large unique-text counts.
+    Raises ImportError when datasketch is not installed.
+    """
+    from datasketch import MinHash, MinHashLSH
+
+    def _shingles(text: str) -> Set[str]:
+        t = text.lower()
+        if len(t) <= 5:
+            return {t}
+        return {t[i:i + 5] for i in range(len(t) - 4)}
+
+    lsh = MinHashLSH(threshold=_SIMILARITY_THRESHOLD, num_perm=_MINHASH_PERMS)
+    minhashes = []
+    for i, text in enumerate(unique_texts):
+        m = MinHash(num_perm=_MINHASH_PERMS)
+        for shingle in _shingles(text):
+            m.update(shingle.encode('utf-8'))
+        minhashes.append(m)
+        lsh.insert(i, m)
+
+    used = np.zeros(len(unique_texts), dtype=bool)
+    groups: List[List[str]] = []
+    for i in range(len(unique_texts)):
+        if used[i]:
+            continue
+        bucket = [j for j in lsh.query(minhashes[i]) if not used[j]]
+        if i not in bucket:
+            bucket.append(i)
+        groups.append([unique_texts[j] for j in bucket])
+        used[bucket] = True
+
+    return groups
+
+
+def _looks_like_english(text: str) -> bool:
+    """Cheap heuristic: pure-ASCII text containing letters."""
+    return text.isascii() and any(c.isalpha() for c in text)
+
+
+def _mostly_target_language(unique_texts: List[str], target_language: str) -> bool:
+    """Check a sample of texts to see if grouping is worth the effort.
+
+    When nearly everything is already in the target language, most groups
+    resolve through the skip path anyway — the vectorize/similarity work
+    would be paid up front for nothing. Only meaningful for 'en', where
+    the ASCII heuristic applies.
+    """
+    if target_language != 'en' or not unique_texts:
+        return False
+    stride = max(1, len(unique_texts) // 500)
+    sample = unique_texts[::stride][:500]
+    hits = sum(1 for text in sample if _looks_like_english(text))
+    return hits / len(sample) >= 0.9
+
+
+def _group_similar_texts(unique_texts: List[str], target_language: str = '') -> List[List[str]]:
+    """Bucket unique texts into near-duplicate groups.
+
+    Falls back to one-text-per-group when neither strategy is usable.
+    """
+    try:
+        if _mostly_target_language(unique_texts, target_language):
+            return [[text] for text in unique_texts]
+
+        # Cheap first pass: texts differing only in case/whitespace
+        # collapse into one bucket via a single hash lookup apiece. The
+        # expensive similarity pass then only sees one representative per
+        # bucket.
+        buckets: Dict[str, List[str]] = {}
+        for text in unique_texts:
+            canon = ' '.join(text.lower().split())
+            buckets.setdefault(canon, []).append(text)
+        representatives = [texts[0] for texts in buckets.values()]
+        rep_to_bucket = {texts[0]: texts for texts in buckets.values()}
+
+        if len(representatives) < _SIMILARITY_MIN_TEXTS:
+            # Too few texts for vectorize + similarity to pay for itself;
+            # exact/canonical duplicates are already collapsed.
+            rep_groups = [[rep] for rep in representatives]
+        elif len(representatives) >= _LSH_MIN_TEXTS:
+            try:
+                rep_groups = _group_texts_minhash(representatives)
+            except ImportError:
+                rep_groups = _group_texts_hashed(representatives)
+        else:
+            rep_groups = _group_texts_hashed(representatives)
+
+        # Expand each representative group back to its full bucket
+        return [
+            [text for rep in rep_group for text in rep_to_bucket[rep]]
+            for rep_group in rep_groups
+        ]
+    except Exception:
+        return [[text] for text in unique_texts]
+
 
 def translate_columns(
     target_language: str = 'en',
@@ -18,6 +357,8 @@ def translate_columns(
     columns_to_process: Optional[List[str]] = None,
     file_path: Optional[str] = None,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    df: Optional[pd.DataFrame] = None,
+    max_workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Translate text columns in the dataset.
@@ -28,6 +369,10 @@ def translate_columns(
         target_language: Target language code (default: 'en' for English)
         source_language: Source language code (default: 'auto' for auto-detect)
         file_path: Path to CSV file. If None, uses config.RAW_DATA_FILE (for CLI/script).
+        df: DataFrame to process in-memory. If provided, no file is read.
+        max_workers: Number of translation worker threads. Defaults to
+            4x the CPU count, capped at 32. Translation is network-bound,
+            so callers can raise this well past the CPU count.
 
     Returns:
         DataFrame with translated columns (prefixed with "T_")
@@ -35,15 +380,17 @@ def translate_columns(
     Raises:
         ValueError: If the dataset is empty or no columns are selected
     """
-    path = file_path if file_path is not None else str(config.RAW_DATA_FILE)
-    data_list: List[Dict] = read_csv_to_dict(path)
-    
-    if not data_list:
+    if df is None:
+        path = file_path if file_path is not None else str(config.RAW_DATA_FILE)
+        # Read straight into a DataFrame — the old to_dict(orient='records')
+        # round-trip materialized a dict per row only to rebuild the frame.
+        df = read_csv(path)
+
+    if df.empty:
         raise ValueError("The dataset is empty")
-    
-    first_row = data_list[0]
-    all_columns = list(first_row.keys())
-    
+
+    all_columns = list(df.columns)
+
     if not all_columns:
         raise ValueError("No columns found in the dataset")
     
@@ -58,218 +405,167 @@ def translate_columns(
     
     if not columns_to_process:
         raise ValueError("No columns selected for translation")
+
+    # Shallow copy: source columns are never modified, only new T_ columns
+    # added, so sharing the underlying data avoids duplicating the whole
+    # dataset while callers still get their input frame back untouched.
+    df_translated = df.copy(deep=False)
     
-    df = pd.DataFrame(data_list)
-    df_translated = df.copy()
-    
-    # Get number of workers (default to CPU count, but cap at reasonable number for API calls)
-    num_workers = min(os.cpu_count() or 4, 10)  # Cap at 10 to avoid overwhelming the API
+    # Workers spend their time blocked on HTTP, not the CPU, so the
+    # default pool is sized for in-flight requests rather than cores.
+    # Capped to stay polite to the API.
+    if max_workers is not None:
+        num_workers = max_workers
+    else:
+        num_workers = min(4 * (os.cpu_count() or 4), 32)
     
-    # Translate each selected column
+    # Bind the language pair and shared caches once for the whole run;
+    # the per-group hot paths are methods on this object rather than
+    # closures re-evaluated against the enclosing scope.
+    session = _TranslationSession(source_language, target_language)
+
+    # Progress is measured in row-equivalents: one unit per row per column.
     total_cols = len(columns_to_process)
     total_rows_global = len(df_translated)
-    total_work = total_cols * total_rows_global  # total row-equivalents (1 per column per row)
-    for col_idx, col_name in enumerate(columns_to_process):
+    total_work = total_cols * total_rows_global
+    rows_done = 0
+
+    # Phase 1: per-column preparation — dedupe texts and group near-
+    # duplicates. No network traffic yet; the expensive translation work
+    # for every column lands in one shared pool below so short columns do
+    # not serialize behind long ones.
+    col_states: List[Dict] = []
+    for col_name in columns_to_process:
         if col_name not in df_translated.columns:
             continue
-        if progress_callback:
-            progress_callback(col_idx * total_rows_global, total_work, f"Translating: {col_idx * total_rows_global}/{total_work} rows")
-        
-        translated_col_name = f"T_{col_name}"
-        
+
         # Get column series for vectorized operations
         col_series = df_translated[col_name]
         total_rows = len(col_series)
-        
-        # Thread-safe translation cache to avoid re-translating duplicate texts
-        translation_cache: Dict[str, str] = {}
-        translation_cache_lock = Lock()
-        # Cache for language detection results
-        lang_cache: Dict[str, str] = {}
-        lang_cache_lock = Lock()
-        
-        # Pre-process: identify empty/null values
-        is_empty = col_series.isna() | (col_series.astype(str).str.strip() == '')
-        
-        # Prepare data: collect all non-empty texts with their indices
-        items_to_translate = []
-        text_to_indices: Dict[str, List[int]] = {}  # Map text -> list of row indices
-        
-        for idx, value in enumerate(col_series):
-            if not is_empty.iloc[idx]:
-                str_value = str(value).strip()
-                items_to_translate.append((idx, str_value))
-                # Track which rows have the same text (exact duplicates)
-                if str_value not in text_to_indices:
-                    text_to_indices[str_value] = []
-                text_to_indices[str_value].append(idx)
-        
-        if not items_to_translate:
+
+        # Pre-process in C: strip once, then one np.unique pass yields the
+        # distinct texts plus the inverse map sending every row to its
+        # unique text — no per-row dict mutation, and the final assembly
+        # becomes a single gather through the inverse.
+        s = col_series.reset_index(drop=True).astype(_STRING_DTYPE).str.strip()
+        # na_value folds the fillna into the conversion — one pass, no
+        # intermediate filled Series.
+        arr = s.to_numpy(dtype=object, na_value='')
+        nonempty_positions = np.flatnonzero(arr != '')
+
+        if nonempty_positions.size == 0:
             # All values are empty
-            df_translated[translated_col_name] = [''] * total_rows
+            df_translated[f"T_{col_name}"] = [''] * total_rows
+            rows_done += total_rows_global
             if progress_callback:
-                progress_callback((col_idx + 1) * total_rows_global, total_work, f"Translating: {(col_idx + 1) * total_rows_global}/{total_work} rows")
+                progress_callback(rows_done, total_work, f"Translating: {rows_done}/{total_work} rows")
             continue
-        
-        # Step 1: Vectorize all unique texts
-        unique_texts = list(text_to_indices.keys())
-        vectorizer = TfidfVectorizer(
-            lowercase=True,
-            stop_words=None,  # Don't remove stop words for better similarity detection
-            ngram_range=(1, 2),  # Use unigrams and bigrams
-            max_features=5000,  # Limit features for efficiency
-            min_df=1,  # Include all terms
-            max_df=0.95  # Exclude very common terms
-        )
-        
-        try:
-            vectors = vectorizer.fit_transform(unique_texts)
-            
-            # Step 2: Compute similarity matrix
-            similarity_matrix = cosine_similarity(vectors)
-            
-            # Step 3: Group similar texts (similarity threshold: 0.85)
-            similarity_threshold = 0.85
-            groups: List[List[str]] = []
-            used_texts: Set[str] = set()
-            
-            for i, text in enumerate(unique_texts):
-                if text in used_texts:
-                    continue
-                
-                # Find all similar texts
-                similar_indices = np.where(similarity_matrix[i] >= similarity_threshold)[0]
-                similar_texts = [unique_texts[j] for j in similar_indices]
-                
-                # Add to group
-                groups.append(similar_texts)
-                used_texts.update(similar_texts)
-            
-        except Exception:
-            # Fallback: if vectorization fails, use original method
-            groups = [[text] for text in unique_texts]
-        
-        # Step 4: Translate groups (translate one representative, apply to all similar)
-        def translate_group(group: List[str]) -> Tuple[Dict[str, str], str]:
-            """Translate a group of similar texts. Returns (translations_dict, status)"""
-            translations = {}
-            
-            # Use the first (shortest) text as representative for translation
-            representative = min(group, key=len)
-            
-            try:
-                str_value = representative.strip()
-                
-                # Check cache first
-                with translation_cache_lock:
-                    if str_value in translation_cache:
-                        cached_translation = translation_cache[str_value]
-                        # Apply to all texts in group
-                        for text in group:
-                            translations[text] = cached_translation
-                        return translations, 'cached'
-                
-                # Language detection only for strings longer than 3 characters
-                if len(str_value) > 3:
-                    with lang_cache_lock:
-                        if str_value in lang_cache:
-                            detected_lang = lang_cache[str_value]
-                        else:
-                            try:
-                                detected_lang = detect(str_value)
-                                lang_cache[str_value] = detected_lang
-                            except (LangDetectException, Exception):
-                                detected_lang = None
-                    
-                    if detected_lang == target_language:
-                        # Already in target language
-                        with translation_cache_lock:
-                            translation_cache[str_value] = str_value
-                        for text in group:
-                            translations[text] = str_value
-                        return translations, 'skipped'
-                
-                # Translate the representative text
-                translator = GoogleTranslator(source=source_language, target=target_language)
-                translated_text = translator.translate(str_value)
-                
-                # Cache and apply to all similar texts in group
-                with translation_cache_lock:
-                    for text in group:
-                        translation_cache[text] = translated_text
-                        translations[text] = translated_text
-                
-                return translations, 'translated'
-                    
-            except Exception as e:
-                # On error, return 'NA' for all texts in group
-                for text in group:
-                    translations[text] = 'NA'
-                return translations, 'error'
-        
-        # Translate all groups in parallel
-        translated_values = [''] * total_rows  # Pre-allocate list
-        skipped_count = 0
-        cached_count = 0
-        grouped_count = 0
-        completed = 0
-        num_groups = len(groups)
-        rows_filled = 0  # rows filled in this column so far (for progress)
-        
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            # Submit all group translation tasks
-            future_to_group = {executor.submit(translate_group, group): group for group in groups}
-            
-            # Process completed translations with progress bar (disabled when progress_callback is set, e.g. Streamlit)
-            with tqdm(total=num_groups, desc=f"Translating {col_name}", unit="group", disable=progress_callback is not None) as pbar:
-                for future in as_completed(future_to_group):
-                    try:
-                        group_translations, status = future.result()
-                        group = future_to_group[future]
-                        
-                        # Apply translations to all rows that have these texts
-                        for text, translation in group_translations.items():
-                            if text in text_to_indices:
-                                for idx in text_to_indices[text]:
-                                    translated_values[idx] = translation
-                        rows_filled += sum(len(text_to_indices.get(text, [])) for text in group_translations)
-                        if progress_callback:
-                            current_work = col_idx * total_rows_global + rows_filled
-                            progress_callback(current_work, total_work, f"Translating: {current_work}/{total_work} rows")
-                        
-                        # Count statistics
-                        if len(group) > 1:
-                            grouped_count += len(group) - 1  # -1 because we translate one, reuse for others
-                        
-                        if status == 'cached':
-                            cached_count += len(group)
-                        elif status == 'skipped':
-                            skipped_count += len(group)
-                        
-                        completed += 1
-                        pbar.set_postfix({
-                            'groups': num_groups,
-                            'grouped': grouped_count,
-                            'cached': cached_count,
-                            'skipped': skipped_count
-                        })
-                        pbar.update(1)
-                    except Exception:
-                        # Handle errors
-                        group = future_to_group[future]
-                        for text in group:
-                            if text in text_to_indices:
-                                for idx in text_to_indices[text]:
-                                    translated_values[idx] = 'NA'
-                        rows_filled += sum(len(text_to_indices.get(text, [])) for text in group)
-                        if progress_callback:
-                            current_work = col_idx * total_rows_global + rows_filled
-                            progress_callback(current_work, total_work, f"Translating: {current_work}/{total_work} rows")
-                        completed += 1
-                        pbar.update(1)
-        
-        df_translated[translated_col_name] = translated_values
-    
+
+        unique_arr, inverse = np.unique(arr[nonempty_positions], return_inverse=True)
+        unique_texts = unique_arr.tolist()
+
+        # Group near-duplicate texts so each group costs one translation
+        groups = _group_similar_texts(unique_texts, target_language)
+
+        col_states.append({
+            'name': col_name,
+            'total_rows': total_rows,
+            'nonempty_positions': nonempty_positions,
+            'inverse': inverse,
+            'text_to_pos': {text: i for i, text in enumerate(unique_texts)},
+            'counts': np.bincount(inverse),  # rows per unique text, for progress
+            'groups': groups,
+            'translated_unique': np.full(len(unique_texts), '', dtype=object),
+        })
+
+    # Phase 2: resolve what we can locally (cache hits, text already in
+    # the target language), then push the remainder through the shared
+    # pool in chunks to keep per-group task overhead down.
+    skipped_count = 0
+    cached_count = 0
+    grouped_count = 0
+    num_groups = sum(len(state['groups']) for state in col_states)
+
+    # Process with progress bar (disabled when progress_callback is set, e.g. Streamlit)
+    with tqdm(total=num_groups, desc=f"Translating {len(col_states)} column(s)", unit="group", disable=progress_callback is not None) as pbar:
+
+        disk_write_buffer: List[Tuple[str, str]] = []
+
+        def apply_result(state: Dict, group: List[str], group_translations: Dict[str, str], status: str) -> None:
+            nonlocal rows_done, skipped_count, cached_count, grouped_count
+
+            # Queue fresh translations for the cross-run disk cache;
+            # flushed in batches to keep commits off the hot path.
+            if status == 'translated':
+                disk_write_buffer.extend(group_translations.items())
+                if len(disk_write_buffer) >= 512:
+                    _disk_cache_put_many(source_language, target_language, disk_write_buffer)
+                    disk_write_buffer.clear()
+            text_to_pos = state['text_to_pos']
+            translated_unique = state['translated_unique']
+            counts = state['counts']
+
+            # Store one value per unique text; rows are filled by a single
+            # gather through the inverse map at the end
+            for text, translation in group_translations.items():
+                pos = text_to_pos.get(text)
+                if pos is not None:
+                    translated_unique[pos] = translation
+                    rows_done += int(counts[pos])
+            if progress_callback:
+                progress_callback(rows_done, total_work, f"Translating: {rows_done}/{total_work} rows")
+
+            # Count statistics
+            if len(group) > 1:
+                grouped_count += len(group) - 1  # -1 because we translate one, reuse for others
+
+            if status == 'cached':
+                cached_count += len(group)
+            elif status == 'skipped':
+                skipped_count += len(group)
+
+            pbar.set_postfix({
+                'groups': num_groups,
+                'grouped': grouped_count,
+                'cached': cached_count,
+                'skipped': skipped_count
+            })
+            pbar.update(1)
+
+        pending: List[Tuple[Dict, List[str], str]] = []
+        for state in col_states:
+            for group in state['groups']:
+                group_translations, status, representative = session.resolve_group_locally(group)
+                if group_translations is not None:
+                    apply_result(state, group, group_translations, status)
+                else:
+                    pending.append((state, group, representative))
+
+        if pending:
+            # Size chunks so every worker gets something to do: with few
+            # pending groups a fixed chunk size would starve the pool
+            # (e.g. 200 groups / 64 = only 4 in-flight tasks). Capped at
+            # 64 so progress still ticks in reasonable steps.
+            batch_size = max(1, min(64, (len(pending) + num_workers - 1) // num_workers))
+            chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            chunk_args = [[(group, rep) for _, group, rep in chunk] for chunk in chunks]
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                # Ordered map: results come back aligned with chunks, so
+                # there is no per-future dict to build and probe — results
+                # stream straight into the zip as chunks complete.
+                for chunk, chunk_results in zip(chunks, executor.map(session.translate_chunk, chunk_args)):
+                    for (state, group, _), (group_translations, status) in zip(chunk, chunk_results):
+                        apply_result(state, group, group_translations, status)
+
+        _disk_cache_put_many(source_language, target_language, disk_write_buffer)
+
+    # Phase 3: expand per-unique-text results to rows with one gather
+    # through the inverse map and attach the columns in selection order.
+    for state in col_states:
+        translated_values = np.full(state['total_rows'], '', dtype=object)
+        translated_values[state['nonempty_positions']] = state['translated_unique'][state['inverse']]
+        df_translated[f"T_{state['name']}"] = pd.array(translated_values, dtype=_STRING_DTYPE)
+
     if progress_callback and total_work:
         progress_callback(total_work, total_work, f"Translating: {total_work}/{total_work} rows - done")
     return df_translated
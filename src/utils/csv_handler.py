@@ -1,17 +1,60 @@
+import csv
+
 import pandas as pd
-from pathlib import Path
-import sys
 
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+import config
+
+CSV_ENCODINGS = config.CSV_ENCODINGS
+CSV_DELIMITERS = config.CSV_DELIMITERS
+
+# CSV_ENCODINGS spelled the way charset_normalizer names codecs (plus
+# ascii, which it reports for plain 7-bit files). Restricting detection
+# to these keeps it from picking an exotic codec the brute-force loop
+# would never have used.
+_CHARSET_ISOLATION = ['ascii', 'utf_8', 'latin_1', 'cp1252']
+
+
+def _read_csv_sniffed(file_path: str) -> pd.DataFrame | None:
+    """
+    Detect encoding and delimiter from the first 64 KB, then parse once
+    with the fast C engine.
+
+    Returns None when detection fails so the caller can fall back to the
+    brute-force loop, which re-reads the file per (encoding, delimiter)
+    attempt.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(65536)
+    if not head:
+        return None
+
+    encoding = None
+    try:
+        import charset_normalizer
+        best = charset_normalizer.from_bytes(
+            head, cp_isolation=_CHARSET_ISOLATION).best()
+        encoding = best.encoding if best is not None else None
+    except ImportError:
+        for enc in CSV_ENCODINGS:
+            try:
+                head.decode(enc)
+                encoding = enc
+                break
+            except (UnicodeDecodeError, LookupError):
+                continue
+    if encoding is None:
+        return None
 
-try:
-    import config
-    CSV_ENCODINGS = config.CSV_ENCODINGS
-    CSV_DELIMITERS = config.CSV_DELIMITERS
-except ImportError:
-    raise ImportError("config.py not found")
+    try:
+        sep = csv.Sniffer().sniff(
+            head.decode(encoding, errors='ignore'),
+            delimiters=''.join(CSV_DELIMITERS),
+        ).delimiter
+    except csv.Error:
+        return None
+
+    df = pd.read_csv(file_path, encoding=encoding, sep=sep, on_bad_lines='skip')
+    return df if len(df.columns) > 1 else None
 
 def read_csv(file_path: str) -> pd.DataFrame:
     """
@@ -28,6 +71,18 @@ def read_csv(file_path: str) -> pd.DataFrame:
         ValueError: If the file cannot be read as CSV or Excel.
     """
 
+    if file_path.lower().endswith('.parquet'):
+        return pd.read_parquet(file_path)
+
+    # Fast path: sniff encoding + delimiter once and parse with the C
+    # engine, instead of re-reading the whole file per failed combination.
+    try:
+        df = _read_csv_sniffed(file_path)
+        if df is not None:
+            return df
+    except Exception:
+        pass
+
     for enc in CSV_ENCODINGS:
         for sep in CSV_DELIMITERS:
             try: